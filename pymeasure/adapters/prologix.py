@@ -61,8 +61,6 @@ class PrologixAdapter(VISAAdapter):
     :param gpib_read_timeout: Set read timeout for GPIB communication in milliseconds from 1..3000
     :param kwargs: Key-word arguments if constructing a new serial object
 
-    :ivar address: Integer GPIB address of the desired instrument.
-
     Usage example:
 
     .. code::
@@ -119,6 +117,17 @@ class PrologixAdapter(VISAAdapter):
         if gpib_read_timeout is not None:
             self.gpib_read_timeout = gpib_read_timeout
 
+    @property
+    def address(self):
+        """Control the integer GPIB address of the desired instrument (int or None)."""
+        return self._address
+
+    @address.setter
+    def address(self, value):
+        self._address = value
+        # cache the prefix sent before every command to the instrument
+        self._address_prefix = None if value is None else "++addr %d\n" % value
+
     @property
     def auto(self):
         """Control whether to address instruments to talk after sending them a command (bool).
@@ -215,18 +224,41 @@ class PrologixAdapter(VISAAdapter):
         self.write(command)
         return self.read()
 
+    def ask_many(self, commands):
+        """Send several queries to the instrument at once and return their responses.
+
+        All commands, each followed by a read request, are sent in a single transfer.
+        The controller processes them one after the other, such that the serial
+        round-trip is paid only once instead of once per query.
+
+        Controller commands (starting with "++") are not supported, as they would be
+        read from the instrument and suppress the GPIB address of the batch.
+
+        :param commands: Iterable of command strings to be sent to the instrument.
+        :returns: List of the responses (str) in the order of the commands.
+        :raises ValueError: If a command is a controller command.
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+        if any(command.startswith("++") for command in commands):
+            raise ValueError("Controller commands ('++') are not supported in `ask_many`.")
+        self.write("\n".join(f"{command}\n++read eoi" for command in commands))
+        return [self.read(prologix=True) for _ in commands]
+
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
-        If the GPIB address in :attr:`address` is defined, it is sent first.
+        If the GPIB address in :attr:`address` is defined, it is sent first,
+        in the same transfer as the command.
 
         :param str command: Command string to be sent to the instrument
             (without termination).
         :param kwargs: Keyword arguments for the connection itself.
         """
         # Overrides write instead of _write in order to ensure proper logging
-        if self.address is not None and not command.startswith("++"):
-            super().write("++addr %d" % self.address, **kwargs)
+        if self._address_prefix is not None and not command.startswith("++"):
+            command = self._address_prefix + command
         super().write(command, **kwargs)
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
@@ -266,9 +298,9 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Key-word arguments to pass onto :meth:`._format_binary_values`
         :returns: number of bytes written
         """
-        if self.address is not None:
-            address_command = "++addr %d\n" % self.address
-            self.write(address_command)
+        if self._address_prefix is not None:
+            # send the address in the same transfer as the data
+            command = self._address_prefix + command
         super().write_binary_values(command, values, "\n", **kwargs)
 
     def _read(self, prologix=False, **kwargs):
@@ -280,7 +312,7 @@ class PrologixAdapter(VISAAdapter):
         """
         if not prologix:
             self.write("++read eoi")
-        return super()._read()
+        return super()._read(**kwargs)
 
     def gpib(self, address, **kwargs):
         """ Return a PrologixAdapter object that references the GPIB
@@ -298,18 +330,19 @@ class PrologixAdapter(VISAAdapter):
         self.write("++srq")
         return int(self.read())
 
-    def wait_for_srq(self, timeout=25, delay=0.1):
+    def wait_for_srq(self, timeout=25, delay=0.005):
         """ Blocks until a SRQ, and leaves the bit high
 
         :param timeout: Timeout duration in seconds.
-        :param delay: Time delay between checking SRQ in seconds.
+        :param delay: Maximum time delay between checking SRQ in seconds.
         :raises TimeoutError: "Waiting for SRQ timed out."
         """
-        stop = time.perf_counter() + timeout
+        stop = time.monotonic() + timeout
         while self._check_for_srq() != 1:
-            if time.perf_counter() > stop:
+            remaining = stop - time.monotonic()
+            if remaining <= 0:
                 raise TimeoutError("Waiting for SRQ timed out.")
-            time.sleep(delay)
+            time.sleep(min(delay, remaining))
 
     def __repr__(self):
         if self.address is not None:
@@ -23,27 +23,72 @@
 #
 
 import logging
+import struct
 
 from enum import IntEnum
+from functools import lru_cache
 
 from pymeasure.instruments import Instrument
 
+try:
+    # Optional compiled implementation of the CRC16 checksum
+    from fastcrc.crc16 import modbus as _crc16_native
+except ImportError:
+    _crc16_native = None
+
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
-def CRC16(data):
-    """Calculate the CRC16 checksum for the data byte array."""
-    CRC = 0xFFFF
+def _crc16_of_byte(value):
+    """Calculate the CRC16 (Modbus) remainder of a single byte value."""
+    crc = value
+    for _ in range(8):
+        lsb = crc & 0x1  # least significant bit
+        crc >>= 1
+        if lsb:
+            crc ^= 0xA001
+    return crc
+
+
+_CRC16_TABLE = tuple(_crc16_of_byte(i) for i in range(256))
+
+# Precompiled big endian frame layouts
+# device address, function code, register address
+_HEADER = struct.Struct(">BBH")
+# header, number of elements
+_HEADER_COUNT = struct.Struct(">BBHH")
+# header, number of elements, number of bytes
+_HEADER_COUNT_BYTES = struct.Struct(">BBHHB")
+_I32 = struct.Struct(">i")
+_U16 = struct.Struct(">H")
+
+
+def _crc16_python(data):
+    """Calculate the CRC16 checksum as an integer with the lookup table."""
+    crc = 0xFFFF
     for octet in data:
-        CRC ^= octet
-        for j in range(8):
-            lsb = CRC & 0x1  # least significant bit
-            CRC = CRC >> 1
-            if lsb:
-                CRC ^= 0xA001
-    return [CRC & 0xFF, CRC >> 8]
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ octet) & 0xFF]
+    return crc
+
+
+def CRC16(data):
+    """Calculate the CRC16 checksum for the data byte array.
+
+    Uses the compiled implementation of the `fastcrc` package, if installed.
+
+    :param data: Bytes-like object (or list of integers) to calculate the checksum of.
+    :return: The two checksum bytes, least significant byte first.
+    """
+    if isinstance(data, list):
+        # iterating bytes is faster than iterating a list of int objects
+        data = bytes(data)
+    if _crc16_native is None:
+        crc = _crc16_python(data)
+    else:
+        crc = _crc16_native(bytes(data))
+    return crc.to_bytes(2, "little")
 
 
 class Functions(IntEnum):
@@ -53,6 +98,15 @@ class Functions(IntEnum):
     W = 0x10  # writing multiple variables
 
 
+@lru_cache(maxsize=64)
+def _parse_command(function, address):
+    """Parse the function name and the register address of a command.
+
+    The few distinct commands of the properties are cached, as they are sent repeatedly.
+    """
+    return Functions[function], int(address, 16) if "x" in address else int(address)
+
+
 class TC038D(Instrument):
     """
     Communication with the HCP TC038D oven.
@@ -85,60 +139,89 @@ class TC038D(Instrument):
             - or the number of elements to read (defaults to 1).
         """
         function, address, *values = command.split(",")
-        function = Functions[function]
-        data = [self.address]  # 1B device address
-        data.append(function)  # 1B function code
-        address = int(address, 16) if "x" in address else int(address)
-        data.extend(address.to_bytes(2, "big"))  # 2B register address
+        function, address = _parse_command(function, address)
+        # header: 1B device address, 1B function code, 2B register address
         if function == Functions.W:
             elements = len(values) * self.byteMode // 2
-            data.extend(elements.to_bytes(2, "big"))  # 2B number of elements
-            data.append(elements * 2)  # 1B number of bytes to write
-            for element in values:
-                data.extend(int(element).to_bytes(self.byteMode, "big", signed=True))
+            value_format = "h" if self.byteMode == 2 else "i"
+            buf = bytearray(7 + len(values) * self.byteMode + 2)
+            # 2B number of elements, 1B number of bytes to write
+            _HEADER_COUNT_BYTES.pack_into(buf, 0, self.address, function, address, elements,
+                                          elements * 2)
+            struct.pack_into(f">{len(values)}{value_format}", buf, 7,
+                             *(int(element) for element in values))
         elif function == Functions.R:
             count = int(values[0]) * self.byteMode // 2 if values else self.byteMode // 2
-            data.extend(count.to_bytes(2, "big"))  # 2B number of elements to read
+            buf = bytearray(8)
+            # 2B number of elements to read
+            _HEADER_COUNT.pack_into(buf, 0, self.address, function, address, count)
         elif function == Functions.ECHO:
-            data[-2:] = [0, 0]
             if values:
-                data.extend(int(values[0]).to_bytes(2, "big"))  # 2B test data
-        data += CRC16(data)
-        self.write_bytes(bytes(data))
+                buf = bytearray(8)
+                # 2B test data
+                _HEADER_COUNT.pack_into(buf, 0, self.address, function, 0, int(values[0]))
+            else:
+                buf = bytearray(6)
+                _HEADER.pack_into(buf, 0, self.address, function, 0)
+        else:
+            buf = bytearray(6)
+            _HEADER.pack_into(buf, 0, self.address, function, address)
+        buf[-2:] = CRC16(memoryview(buf)[:-2])
+        self.write_bytes(buf)
+
+    def _read_into(self, frame, position, count):
+        """Read `count` bytes into `frame` at `position` and return the new end position."""
+        received = self.read_bytes(count)
+        if len(received) != count:
+            raise ConnectionError(
+                f"Incomplete response, received {len(received)} of {count} bytes: "
+                f"{bytes(frame[:position]) + received}")
+        frame[position:position + count] = received
+        return position + count
+
+    @staticmethod
+    def _check_crc(frame, end):
+        """Check the CRC of the first `end` bytes of `frame`."""
+        if frame[end - 2:end] != CRC16(memoryview(frame)[:end - 2]):
+            raise ConnectionError("Response CRC does not match.")
 
     def read(self):
         """Read response and interpret the number, returning it as a string."""
-        # Slave address, function
-        got = self.read_bytes(2)
-        if got[1] == Functions.R:
-            # length of data to follow
-            length = self.read_bytes(1)
+        # maximum response: 3B header, up to 255B data, 2B CRC
+        frame = bytearray(3 + 255 + 2)
+        # Slave address, function, and data length (R), start address (W, ECHO),
+        # or error code (error)
+        end = self._read_into(frame, 0, 3)
+        function = frame[1]
+        if function == Functions.R:
+            length = frame[2]
             # data length, 2 Byte CRC
-            read = self.read_bytes(length[0] + 2)
-            if read[-2:] != bytes(CRC16(got + length + read[:-2])):
-                raise ConnectionError("Response CRC does not match.")
-            return str(int.from_bytes(read[:-2], byteorder="big", signed=True))
-        elif got[1] == Functions.W:
-            # start address, number elements, CRC; each 2 Bytes long
-            got += self.read_bytes(2 + 2 + 2)
-            if got[-2:] != bytes(CRC16(got[:-2])):
-                raise ConnectionError("Response CRC does not match.")
-        elif got[1] == Functions.ECHO:
-            # start address 0, data, CRC; each 2B
-            got += self.read_bytes(2 + 2 + 2)
-            if got[-2:] != bytes(CRC16(got[:-2])):
-                raise ConnectionError("Response CRC does not match.")
-            return str(int.from_bytes(got[-4:-2], "big"))
+            end = self._read_into(frame, end, length + 2)
+            self._check_crc(frame, end)
+            if length == 4:
+                return str(_I32.unpack_from(frame, 3)[0])
+            return str(int.from_bytes(memoryview(frame)[3:3 + length], byteorder="big",
+                                      signed=True))
+        elif function == Functions.W:
+            # rest of start address, number elements, CRC; each 2 Bytes long
+            end = self._read_into(frame, end, 1 + 2 + 2)
+            self._check_crc(frame, end)
+        elif function == Functions.ECHO:
+            # rest of start address 0, data, CRC; each 2B
+            end = self._read_into(frame, end, 1 + 2 + 2)
+            self._check_crc(frame, end)
+            return str(_U16.unpack_from(frame, 4)[0])
         else:  # an error occurred
-            # got[1] is functioncode + 0x80
-            end = self.read_bytes(3)  # error code and CRC
+            # function is functioncode + 0x80
+            error = frame[2]
+            end = self._read_into(frame, end, 2)  # CRC
             errors = {0x02: "Wrong start address.",
                       0x03: "Variable data error.",
                       0x04: "Operation error."}
-            if end[0] in errors.keys():
-                raise ValueError(errors[end[0]])
+            if error in errors.keys():
+                raise ValueError(errors[error])
             else:
-                raise ConnectionError(f"Unknown read error. Received: {got} {end}")
+                raise ConnectionError(f"Unknown read error. Received: {bytes(frame[:end])}")
 
     def check_set_errors(self):
         """Check for errors after having set a property.
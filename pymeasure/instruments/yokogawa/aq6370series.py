@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 
 import logging
+from functools import partial
+
+import numpy as np
 
 from pymeasure.instruments import Instrument, SCPIMixin
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
@@ -31,10 +34,32 @@ log.addHandler(logging.NullHandler())
 
 
 class AQ6370Series(SCPIMixin, Instrument):
-    """Represents Yokogawa AQ6370 Series of optical spectrum analyzer."""
+    """Represents Yokogawa AQ6370 Series of optical spectrum analyzer.
+
+    :param data_format: Format of the trace data transfer, which is set before the first
+        trace data transfer, see :attr:`data_format`. Binary formats are faster than 'ASCII'.
+        `None` keeps the current setting of the instrument, which is queried instead.
+    """
+
+    _data_formats = ["ASCII", "REAL,64", "REAL,32"]
+    _binary_dtypes = {"REAL,64": "<f8", "REAL,32": "<f4"}
 
-    def __init__(self, adapter, name="Yokogawa AQ3670D OSA", **kwargs):
+    def __init__(self, adapter, name="Yokogawa AQ3670D OSA", data_format=None, **kwargs):
         super().__init__(adapter, name, **kwargs)
+        self._data_format = None
+        # Whether the instrument uses the data format, which is configured lazily
+        self._data_format_configured = False
+        if data_format is not None:
+            self.data_format = data_format
+
+    def reset(self):
+        """Reset the instrument.
+
+        The reset restores the default data format of the instrument, therefore the data
+        format of the driver is sent again before the next trace data transfer.
+        """
+        super().reset()
+        self._data_format_configured = False
 
     # Initiate and abort sweep ---------------------------------------------------------------------
 
@@ -176,25 +201,138 @@ class AQ6370Series(SCPIMixin, Instrument):
         else:
             self.write(f":TRACe:DELete TR{trace.replace('TR', '')}")
 
-    def get_xdata(self, trace="TRA"):
+    @property
+    def data_format(self):
+        """Control the format of the trace data transfer (str 'ASCII', 'REAL,64', 'REAL,32').
+
+        The binary formats 'REAL,64' and 'REAL,32' transfer fewer bytes than 'ASCII'
+        and do not require parsing of text. They require an adapter which reads raw bytes
+        upon request, which a :class:`~pymeasure.adapters.PrologixAdapter` does only with
+        `auto` enabled. Setting the value sends it to the instrument
+        before the next trace data transfer. The value is cached, changes at the
+        instrument itself are not detected.
+        """
+        if self._data_format is None:
+            self._query_data_format()
+        return self._data_format
+
+    @data_format.setter
+    def data_format(self, value):
+        self._bind_data_format(strict_discrete_set(value, self._data_formats))
+        self._data_format_configured = False
+
+    def _bind_data_format(self, value):
+        """Store the data format and bind the matching trace data reader and parser."""
+        self._data_format = value
+        if value == "ASCII":
+            self._read_trace_data = self.read
+            self._parse_trace_data = self._parse_ascii_data
+        else:
+            self._read_trace_data = self._read_binary_block
+            self._parse_trace_data = partial(self._parse_binary_data,
+                                             dtype=self._binary_dtypes[value])
+
+    def _query_data_format(self):
+        """Query the data format of the instrument and bind the matching reader and parser."""
+        value = self.ask(":FORMat:DATA?").strip().upper()
+        self._bind_data_format("REAL,64" if value == "REAL" else value)
+        self._data_format_configured = True
+
+    def _configure_data_format(self):
+        """Send the data format to the instrument, or query it, if not yet done."""
+        if self._data_format_configured:
+            return
+        if self._data_format is None:
+            self._query_data_format()
+        else:
+            self.write(f":FORMat:DATA {self._data_format}")
+            self._data_format_configured = True
+
+    def _read_binary_block(self):
+        """Read an IEEE 488.2 definite length block and return its data bytes.
+
+        The block has to be followed by exactly one line feed, the terminator of the
+        instrument. Other terminators, like CR+LF or EOI only, are not supported.
+        """
+        # '#', number of length digits, length, data
+        header = self.read_bytes(2)
+        length = int(self.read_bytes(int(header[1:2])))
+        data = self.read_bytes(length)
+        termination = self.read_bytes(1)
+        if termination != b"\n":
+            raise ConnectionError(
+                f"Expected a line feed after the binary block, received {termination}.")
+        return data
+
+    @staticmethod
+    def _copy_to(values, out):
+        """Copy `values` to the beginning of `out` and return the filled part."""
+        out = out[:values.size]
+        out[:] = values
+        return out
+
+    def _parse_ascii_data(self, data, out=None):
+        """Interpret comma separated ASCII trace data, optionally storing it in `out`."""
+        # raises a ValueError for malformed data instead of truncating it
+        values = np.array(data.split(","), dtype=float)
+        if out is None:
+            return values
+        return self._copy_to(values, out)
+
+    def _parse_binary_data(self, data, out=None, dtype="<f8"):
+        """Interpret binary trace data, optionally storing it in `out`."""
+        values = np.frombuffer(data, dtype=dtype)
+        if out is None:
+            return values.astype(float)
+        return self._copy_to(values, out)
+
+    def get_xdata(self, trace="TRA", out=None):
         """
         Measure the x-axis data of specified trace, output wavelength in m.
 
         :param trace: Trace to measure (str 'A', 'B', 'C', ...).
-        :return: The x-axis data of specified trace.
+        :param out: Optional preallocated numpy array to store the data in, for example
+            to reuse it for subsequent sweeps. It has to hold at least the number of samples.
+        :return: The x-axis data of specified trace as a numpy array.
         """
+        self._configure_data_format()
+        self.write(f":TRACe:X? TR{trace.replace('TR', '')}")
+        return self._parse_trace_data(self._read_trace_data(), out)
 
-        return self.values(f":TRACe:X? TR{trace.replace('TR', '')}")
-
-    def get_ydata(self, trace="TRA"):
+    def get_ydata(self, trace="TRA", out=None):
         """
         Measure the y-axis data of specified trace, output power in dBm.
 
         :param trace: Trace to measure (str 'A', 'B', 'C', ...).
-        :return: The y-axis data of specified trace.
+        :param out: Optional preallocated numpy array to store the data in, for example
+            to reuse it for subsequent sweeps. It has to hold at least the number of samples.
+        :return: The y-axis data of specified trace as a numpy array.
         """
+        self._configure_data_format()
+        self.write(f":TRACe:Y? TR{trace.replace('TR', '')}")
+        return self._parse_trace_data(self._read_trace_data(), out)
 
-        return self.values(f":TRACe:Y? TR{trace.replace('TR', '')}")
+    def get_trace(self, trace="TRA", x_out=None, y_out=None):
+        """
+        Measure the x-axis and y-axis data of specified trace.
+
+        The y-axis data is requested before the x-axis data is parsed, such that
+        the instrument prepares the second transfer in the meantime.
+
+        :param trace: Trace to measure (str 'A', 'B', 'C', ...).
+        :param x_out: Optional preallocated numpy array for the x-axis data, see :meth:`get_xdata`.
+        :param y_out: Optional preallocated numpy array for the y-axis data, see :meth:`get_ydata`.
+        :return: Tuple of numpy arrays of the x-axis data (wavelength in m) and
+            y-axis data (power in dBm).
+        """
+        self._configure_data_format()
+        trace = trace.replace('TR', '')
+        self.write(f":TRACe:X? TR{trace}")
+        x_reply = self._read_trace_data()
+        self.write(f":TRACe:Y? TR{trace}")
+        xdata = self._parse_trace_data(x_reply, x_out)
+        ydata = self._parse_trace_data(self._read_trace_data(), y_out)
+        return xdata, ydata
 
     # Analysis -------------------------------------------------------------------------------------
 
@@ -236,7 +374,6 @@ class AQ6370D(AQ6370Series):
         map_values=True,
         values={"1x": 0, "2x": 1},
     )
-    pass
 
 
 class AQ6370C(AQ6370Series):
@@ -250,7 +387,6 @@ class AQ6370C(AQ6370Series):
         map_values=True,
         values={"1x": 0, "2x": 1},
     )
-    pass
 
 
 class AQ6373(AQ6370Series):
@@ -272,7 +408,6 @@ class AQ6373(AQ6370Series):
         5e-9,
         10e-9,
     ]
-    pass
 
 
 class AQ6373B(AQ6373):
@@ -286,7 +421,6 @@ class AQ6373B(AQ6373):
         map_values=True,
         values={"1x": 0, "2x": 1},
     )
-    pass
 
 
 class AQ6375(AQ6370Series):
@@ -304,7 +438,6 @@ class AQ6375(AQ6370Series):
         1e-9,
         2e-9,
     ]
-    pass
 
 
 class AQ6375B(AQ6375):
@@ -318,4 +451,3 @@ class AQ6375B(AQ6375):
         map_values=True,
         values={"1x": 0, "2x": 1},
     )
-    pass
@@ -82,12 +82,23 @@ def test_write_address():
     with expected_protocol(
             PrologixAdapter,
             [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
-             ("++addr 5", None), ("something", None)],
+             ("++addr 5\nsomething", None)],
             address=5,
     ) as adapter:
         adapter.write("something")
 
 
+def test_write_changed_address():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++addr 7\nsomething", None)],
+            address=5,
+    ) as adapter:
+        adapter.address = 7
+        adapter.write("something")
+
+
 def test_read():
     with expected_protocol(
             PrologixAdapter,
@@ -98,6 +109,35 @@ def test_read():
         assert adapter.read() == "response"
 
 
+def test_ask_many():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5\nA?\n++read eoi\nB?\n++read eoi", None),
+                         (None, "1"), (None, "2")],
+            address=5,
+    ) as adapter:
+        assert adapter.ask_many(["A?", "B?"]) == ["1", "2"]
+
+
+def test_ask_many_empty():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm,
+            address=5,
+    ) as adapter:
+        assert adapter.ask_many([]) == []
+
+
+def test_ask_many_controller_command():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm,
+            address=5,
+    ) as adapter:
+        with pytest.raises(ValueError, match="Controller commands"):
+            adapter.ask_many(["++ver", "A?"])
+
+
 def test_write_bytes():
     with expected_protocol(
             PrologixAdapter,
@@ -122,6 +162,15 @@ def test_write_binary_values(test_input, expected):
         adapter.write_binary_values("OUTP", test_input, datatype='B')
 
 
+def test_write_binary_values_address():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [(b"++addr 5\nOUTP#13\x01\x02\x03\n", None)],
+            address=5,
+    ) as adapter:
+        adapter.write_binary_values("OUTP", [1, 2, 3], datatype='B')
+
+
 def test_wait_for_srq():
     with expected_protocol(
             PrologixAdapter,
@@ -129,3 +178,13 @@ def test_wait_for_srq():
              ("++srq", None), ("++read eoi", "0"), ("++srq", None), ("++read eoi", "1")]
     ) as adapter:
         adapter.wait_for_srq()
+
+
+def test_wait_for_srq_timeout():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+             ("++srq", None), ("++read eoi", "0")]
+    ) as adapter:
+        with pytest.raises(TimeoutError):
+            adapter.wait_for_srq(timeout=0)
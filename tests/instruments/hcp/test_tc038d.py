@@ -28,6 +28,20 @@ from pymeasure.test import expected_protocol
 
 
 from pymeasure.instruments.hcp import TC038D
+from pymeasure.instruments.hcp.tc038d import CRC16, _crc16_python
+
+
+def test_CRC16():
+    # Checksum from manual.
+    assert CRC16(b"\x01\x03\x00\x00\x00\x02") == b"\xC4\x0B"
+
+
+def test_CRC16_list():
+    assert CRC16([0x01, 0x03, 0x00, 0x00, 0x00, 0x02]) == b"\xC4\x0B"
+
+
+def test_CRC16_python_fallback():
+    assert _crc16_python(b"\x01\x03\x00\x00\x00\x02") == 0x0BC4
 
 
 # Testing the 'write multiple values' method of the device.
@@ -87,6 +101,17 @@ def test_read_CRC_error():
             inst.temperature
 
 
+def test_read_incomplete_response():
+    """Test whether a truncated response, e.g. due to a timeout, raises an Exception."""
+    with expected_protocol(
+        TC038D,
+        [(b"\x01\x03\x00\x00\x00\x02\xC4\x0B",
+          b"\x01\x03\x04\x00\x00\x03")],
+    ) as inst:
+        with pytest.raises(ConnectionError, match="Incomplete response"):
+            inst.temperature
+
+
 def test_read_address_error():
     """Test whether the error code (byte 2) of 2 raises the right error."""
     with expected_protocol(
@@ -23,7 +23,10 @@
 #
 
 import importlib
-from pathlib import Path
+import pkgutil
+from collections import deque
+from functools import lru_cache
+from itertools import chain
 from unittest.mock import MagicMock
 
 import pytest
@@ -33,71 +36,98 @@ from pymeasure.instruments import Instrument, Channel, generic_types
 
 
 # Collect all instruments
+def find_subclasses(cls):
+    """Yield `cls` and all its direct and indirect subclasses, each once."""
+    seen = {cls}
+    stack = [cls]
+    while stack:
+        klass = stack.pop()
+        yield klass
+        for subclass in klass.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                stack.append(subclass)
+
+
 def find_devices_in_module(module):
-    devices = set()
-    channels = set()
-    base_dir = Path(module.__path__[0])
-    base_import = module.__package__ + "."
-    for inst_file in Path(base_dir).rglob("*.py"):
-        relative_path = inst_file.relative_to(base_dir)
-        if inst_file == "__init__.py":
-            # import parent module when filename __init__.py
-            relative_import = ".".join(relative_path.parts[:-1])[:-3]
-        else:
-            relative_import = ".".join(relative_path.parts)[:-3]
-        try:
-            submodule = importlib.import_module(base_import + relative_import)
-            for dev in dir(submodule):
-                if dev.startswith("__"):
-                    continue
-                d = getattr(submodule, dev)
-                try:
-                    i = issubclass(d, Instrument)
-                    c = issubclass(d, Channel)
-                except TypeError:
-                    # d is no class
-                    continue
-                else:
-                    if i:
-                        devices.add(d)
-                    elif c:
-                        channels.add(d)
-        except ModuleNotFoundError:
-            # Some non-required driver dependencies may not be installed on test computer,
-            # for example ni.VirtualBench
-            pass
-        except (OSError, AttributeError):
-            # On Windows instruments.ni.daqmx can raise an OSError before ModuleNotFoundError
-            # when checking installed driver files
-            # it raises an AttributeError under Python 312
-            pass
-    return devices, channels
-
-
-devices, channels = find_devices_in_module(instruments)
+    # Import all submodules, which registers their classes as subclasses of the base classes.
+    # Breadth first, such that each package is listed once and only imported packages are
+    # searched for further modules.
+    imported = set()
+    packages = deque([module])
+    while packages:
+        package = packages.popleft()
+        for module_info in pkgutil.iter_modules(package.__path__, prefix=package.__name__ + "."):
+            try:
+                submodule = importlib.import_module(module_info.name)
+            except ModuleNotFoundError:
+                # Some non-required driver dependencies may not be installed on test computer,
+                # for example ni.VirtualBench
+                continue
+            except (OSError, AttributeError):
+                # On Windows instruments.ni.daqmx can raise an OSError before ModuleNotFoundError
+                # when checking installed driver files
+                # it raises an AttributeError under Python 312
+                continue
+            imported.add(module_info.name)
+            if module_info.ispkg:
+                packages.append(submodule)
+    # dicts keep the discovery order, which gives a stable test order
+    # Subclasses defined elsewhere, for example in other tests, are ignored.
+    devices = {d: None for d in find_subclasses(Instrument) if d.__module__ in imported}
+    channels = {c: None for c in find_subclasses(Channel)
+                if c.__module__ in imported and c not in devices}
+    return list(devices), list(channels)
+
+
+@lru_cache(maxsize=None)
+def get_devices():
+    """Return the devices and channels of all instrument modules, importing them at first call."""
+    return find_devices_in_module(instruments)
+
 
 # Collect all properties
-properties = []
-for device in devices.union(channels):
-    for property_name in dir(device):
-        prop = getattr(device, property_name)
-        if isinstance(prop, property):
-            properties.append((device, property_name, prop))
-for mixin in dir(generic_types):
-    if mixin in ("Instrument", "Channel", "CommonBase"):  # exclucion list.
-        continue
-    elif mixin[0].isupper():
-        # filter only classes
-        device = getattr(generic_types, mixin)
-        for property_name in dir(device):
-            prop = getattr(device, property_name)
-            if isinstance(prop, property):
-                properties.append((device, property_name, prop))
+def find_properties(cls):
+    """Yield name and property of all properties of `cls` without invoking any descriptor."""
+    seen = set()
+    for klass in cls.__mro__:
+        for name, obj in vars(klass).items():
+            if name in seen:
+                # overridden in a subclass
+                continue
+            seen.add(name)
+            if isinstance(obj, property):
+                yield name, obj
+
+
+def docstring_start(prop):
+    """Return the first word of the docstring of `prop`, or an empty string."""
+    words = (prop.__doc__ or "").split(maxsplit=1)
+    return words[0] if words else ""
+
+
+@lru_cache(maxsize=None)
+def get_properties():
+    """Return device, name, property, and docstring start of the properties of all devices,
+    channels, and mixins.
+    """
+    devices, channels = get_devices()
+    properties = []
+    for device in chain(devices, channels):
+        for property_name, prop in find_properties(device):
+            properties.append((device, property_name, prop, docstring_start(prop)))
+    for mixin in vars(generic_types).values():
+        if isinstance(mixin, type) and mixin.__module__ == generic_types.__name__:
+            # only the classes defined there, not the imported base classes
+            for property_name, prop in find_properties(mixin):
+                properties.append((mixin, property_name, prop, docstring_start(prop)))
+    return properties
+
 
 # Instruments unable to accept an Adapter instance.
-proper_adapters = []
+proper_adapters = frozenset()
 # Instruments with communication in their __init__, which consequently fails.
-need_init_communication = [
+need_init_communication = frozenset({
     "SwissArmyFake",
     "FakeInstrument",
     "ThorlabsPM100USB",
@@ -110,9 +140,9 @@ need_init_communication = [
     "HP8116A",
     "IBeamSmart",
     "ANC300Controller",
-]
+})
 # Channels which are still an Instrument subclass
-channel_as_instrument_subclass = [
+channel_as_instrument_subclass = frozenset({
     "SMU",  # agilent/agilent4156
     "VMU",  # agilent/agilent4156
     "VSU",  # agilent/agilent4156
@@ -120,9 +150,31 @@ channel_as_instrument_subclass = [
     "VAR1",  # agilent/agilent4156
     "VAR2",  # agilent/agilent4156
     "VARD",  # agilent/agilent4156
-]
+})
+# Devices which cannot be instantiated with an adapter mock
+not_instantiable = proper_adapters | need_init_communication | channel_as_instrument_subclass
+
+
+@lru_cache(maxsize=None)
+def get_named_devices():
+    """Return the devices which can be instantiated with an adapter mock and a name."""
+    devices, _ = get_devices()
+    return [d for d in devices if d.__name__ not in not_instantiable]
+
+
+@lru_cache(maxsize=None)
+def get_instantiable_devices():
+    """Return the devices which can be instantiated with an adapter mock alone.
+
+    The `Instrument` base class requires a name.
+    """
+    return [d for d in get_named_devices() if d.__name__ != "Instrument"]
+
+
+# Allowed first words of property docstrings
+docstring_starts = frozenset({"Control", "Measure", "Set", "Get"})
 # Instruments whose property docstrings are not YET in accordance with the style (Get, Set, Control)
-grandfathered_docstring_instruments = [
+grandfathered_docstring_instruments = frozenset({
     "AWG401x_AFG",
     "AWG401x_AWG",
     "AdvantestR624X",
@@ -194,104 +246,109 @@ grandfathered_docstring_instruments = [
     "IonGaugeAndPressureChannel",
     "PressureChannel",
     "SequenceEntry",
+    "AnalogChannel",  # SequenceEntry
     "ChannelBase",
     "ChannelAWG",
     "ChannelAFG",
-]
+})
+
+
+def property_name_to_id(value):
+    """Create a test id from `value`."""
+    device, property_name, *_ = value
+    return f"{device.__name__}.{property_name}"
+
+
+@lru_cache(maxsize=None)
+def get_property_params():
+    """Return the parameters of the docstring test, marking grandfathered devices as skipped."""
+    params = []
+    for prop_set in get_properties():
+        device = prop_set[0]
+        marks = ()
+        if device.__name__ in grandfathered_docstring_instruments:
+            reason = f"{device.__name__} is in the codebase and has to be refactored later on."
+            marks = pytest.mark.skip(reason=reason)
+        params.append(pytest.param(prop_set, id=property_name_to_id(prop_set), marks=marks))
+    return params
+
+
+def build_params(argname, test_name):
+    """Return the parameters of the argument `argname` of the test `test_name`.
+
+    The devices are filtered and the grandfathered properties are marked as skipped, such that
+    the test bodies do not run for them.
+    """
+    if argname == "prop_set":
+        return get_property_params()
+    elif argname == "cls":
+        if test_name == "test_name_argument":
+            return get_named_devices()
+        return get_instantiable_devices()
+    raise ValueError(f"No parameters defined for argument '{argname}'.")
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the tests, discovering the devices only when the tests are collected."""
+    for argname in ("cls", "prop_set"):
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(argname,
+                                 build_params(argname, metafunc.definition.originalname))
+
 
+@pytest.fixture
+def adapter_mock():
+    """Return a fresh adapter mock.
 
-@pytest.mark.parametrize("cls", devices)
-def test_adapter_arg(cls):
+    A new mock per test is necessary, as copies of a mock share their child mocks.
+    """
+    return MagicMock()
+
+
+def test_adapter_arg(cls, adapter_mock):
     "Test that every instrument has adapter as their input argument."
-    if cls.__name__ in proper_adapters:
-        pytest.skip(f"{cls.__name__} does not accept an Adapter instance.")
-    elif cls.__name__ in need_init_communication:
-        pytest.skip(f"{cls.__name__} requires communication in init.")
-    elif cls.__name__ in channel_as_instrument_subclass:
-        pytest.skip(f"{cls.__name__} is a channel, not an instrument.")
-    elif cls.__name__ == "Instrument":
-        pytest.skip("`Instrument` requires a `name` parameter.")
-    cls(adapter=MagicMock())
-
-
-@pytest.mark.parametrize("cls", devices)
-def test_name_argument(cls):
+    cls(adapter=adapter_mock)
+
+
+def test_name_argument(cls, adapter_mock):
     "Test that every instrument accepts a name argument."
-    if cls.__name__ in (*proper_adapters, *need_init_communication):
-        pytest.skip(f"{cls.__name__} cannot be tested without communication.")
-    elif cls.__name__ in channel_as_instrument_subclass:
-        pytest.skip(f"{cls.__name__} is a channel, not an instrument.")
-    inst = cls(adapter=MagicMock(), name="Name_Test")
+    inst = cls(adapter=adapter_mock, name="Name_Test")
     assert inst.name == "Name_Test"
 
 
 # This uses a pyvisa-sim default instrument, we could also define our own.
 SIM_RESOURCE = "ASRL2::INSTR"
-is_pyvisa_sim_not_installed = not bool(importlib.util.find_spec("pyvisa_sim"))
+is_pyvisa_sim_not_installed = importlib.util.find_spec("pyvisa_sim") is None
 
 
 @pytest.mark.skipif(
     is_pyvisa_sim_not_installed, reason="PyVISA tests require the pyvisa-sim library"
 )
-@pytest.mark.parametrize("cls", devices)
 def test_kwargs_to_adapter(cls):
     """Verify that kwargs are accepted and handed to the adapter."""
-    if cls.__name__ in (*proper_adapters, *need_init_communication):
-        pytest.skip(f"{cls.__name__} cannot be tested without communication.")
-    elif cls.__name__ in channel_as_instrument_subclass:
-        pytest.skip(f"{cls.__name__} is a channel, not an instrument.")
-    elif cls.__name__ == "Instrument":
-        pytest.skip("`Instrument` requires a `name` parameter.")
-
     with pytest.raises(
         ValueError, match="'kwarg_test' is not a valid attribute for type SerialInstrument"
     ):
         cls(SIM_RESOURCE, visa_library="@sim", kwarg_test=True)
 
 
-@pytest.mark.parametrize("cls", devices)
 @pytest.mark.filterwarnings(
     "error:It is deprecated to specify `includeSCPI` implicitly:FutureWarning")
-def test_includeSCPI_explicitly_set(cls):
-    if cls.__name__ in (*proper_adapters, *need_init_communication):
-        pytest.skip(f"{cls.__name__} cannot be tested without communication.")
-    elif cls.__name__ in channel_as_instrument_subclass:
-        pytest.skip(f"{cls.__name__} is a channel, not an instrument.")
-    elif cls.__name__ == "Instrument":
-        pytest.skip("`Instrument` requires a `name` parameter.")
-
-    cls(adapter=MagicMock())
+def test_includeSCPI_explicitly_set(cls, adapter_mock):
+    cls(adapter=adapter_mock)
     # assert that no error is raised
 
 
-@pytest.mark.parametrize("cls", devices)
 @pytest.mark.filterwarnings(
     "error:Defining SCPI base functionality with `includeSCPI=True` is deprecated:FutureWarning")
-def test_includeSCPI_not_set_to_True(cls):
-    if cls.__name__ in (*proper_adapters, *need_init_communication):
-        pytest.skip(f"{cls.__name__} cannot be tested without communication.")
-    elif cls.__name__ in channel_as_instrument_subclass:
-        pytest.skip(f"{cls.__name__} is a channel, not an instrument.")
-    elif cls.__name__ == "Instrument":
-        pytest.skip("`Instrument` requires a `name` parameter.")
-
-    cls(adapter=MagicMock())
+def test_includeSCPI_not_set_to_True(cls, adapter_mock):
+    cls(adapter=adapter_mock)
     # assert that no error is raised
 
 
-def property_name_to_id(value):
-    """Create a test id from `value`."""
-    device, property_name, prop = value
-    return f"{device.__name__}.{property_name}"
-
-
-@pytest.mark.parametrize("prop_set", properties, ids=property_name_to_id)
 def test_property_docstrings(prop_set):
-    device, property_name, prop = prop_set
-    if device.__name__ in grandfathered_docstring_instruments:
-        pytest.skip(f"{device.__name__} is in the codebase and has to be refactored later on.")
-    start = prop.__doc__.split(maxsplit=1)[0]
-    assert start in ("Control", "Measure", "Set", "Get"), (
+    device, property_name, prop, start = prop_set
+    assert start in docstring_starts, (
         f"'{device.__name__}.{property_name}' docstring does start with '{start}', not 'Control', "
         "'Measure', 'Get', or 'Set'."
     )
@@ -1,5 +1,9 @@
+import struct
+
+import numpy as np
 import pytest
 
+from pymeasure.adapters import PrologixAdapter
 from pymeasure.instruments.yokogawa.aq6370series import AQ6370D
 from pymeasure.test import expected_protocol
 
@@ -12,6 +16,16 @@ def test_init():
         pass  # Verify the expected communication.
 
 
+def test_data_format_getter():
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA?", b"REAL,32\n")],
+        data_format=None,
+    ) as inst:
+        assert inst.data_format == "REAL,32"
+        assert inst.data_format == "REAL,32"  # cached value
+
+
 def test_automatic_sample_number_setter():
     with expected_protocol(
         AQ6370D,
@@ -178,7 +192,7 @@ def test_get_analysis():
 def test_get_xdata():
     with expected_protocol(
         AQ6370D,
-        [
+        [(b":FORMat:DATA ASCII", None)] + [
             (
                 b":TRACe:X? TRA",
                 b"""+8.45000000E-007,+8.45100000E-007,+8.45200000E-007,+8.45300000E-007,
@@ -209,10 +223,11 @@ def test_get_xdata():
                 +8.55000000E-007\n""",
             )
         ],
+        data_format="ASCII",
     ) as inst:
         assert inst.get_xdata(
             *("TRA",),
-        ) == [
+        ).tolist() == [
             8.45e-07,
             8.451e-07,
             8.452e-07,
@@ -320,7 +335,7 @@ def test_get_xdata():
 def test_get_ydata():
     with expected_protocol(
         AQ6370D,
-        [
+        [(b":FORMat:DATA ASCII", None)] + [
             (
                 b":TRACe:Y? TRA",
                 b"""-5.80586383E+001,-4.82452558E+001,-2.10000000E+002,-5.00581515E+001,
@@ -351,10 +366,11 @@ def test_get_ydata():
                 -6.89463024E+001\n""",
             )
         ],
+        data_format="ASCII",
     ) as inst:
         assert inst.get_ydata(
             *("TRA",),
-        ) == [
+        ).tolist() == [
             -58.0586383,
             -48.2452558,
             -210.0,
@@ -459,6 +475,137 @@ def test_get_ydata():
         ]
 
 
+def test_get_xdata_binary():
+    xdata = [8.45e-07, 8.451e-07]
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n")],
+        data_format="REAL,64",
+    ) as inst:
+        assert inst.get_xdata().tolist() == xdata
+
+
+def test_get_xdata_binary_out():
+    xdata = [8.45e-07, 8.451e-07]
+    out = np.zeros(5)
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n")],
+        data_format="REAL,64",
+    ) as inst:
+        result = inst.get_xdata(out=out)
+    assert result.tolist() == xdata
+    assert np.shares_memory(result, out)
+
+
+def test_get_ydata_binary():
+    ydata = [-58.0, -210.0]
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,32", None),
+         (b":TRACe:Y? TRA", b"#18" + struct.pack("<2f", *ydata) + b"\n")],
+        data_format="REAL,32",
+    ) as inst:
+        assert inst.get_ydata().tolist() == ydata
+
+
+def test_data_format_sent_once():
+    xdata = [8.45e-07, 8.451e-07]
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n"),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n"),
+         (b":FORMat:DATA REAL,32", None),
+         (b":TRACe:X? TRA", b"#18" + struct.pack("<2f", *xdata) + b"\n")],
+        data_format="REAL,64",
+    ) as inst:
+        inst.get_xdata()
+        inst.get_xdata()
+        inst.data_format = "REAL,32"
+        assert inst.get_xdata().tolist() == pytest.approx(xdata)
+
+
+def test_data_format_sent_after_reset():
+    xdata = [8.45e-07, 8.451e-07]
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n"),
+         (b"*RST", None),
+         (b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\n")],
+        data_format="REAL,64",
+    ) as inst:
+        inst.get_xdata()
+        inst.reset()
+        assert inst.get_xdata().tolist() == xdata
+
+
+def test_get_xdata_binary_wrong_termination():
+    xdata = [8.45e-07, 8.451e-07]
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA REAL,64", None),
+         (b":TRACe:X? TRA", b"#216" + struct.pack("<2d", *xdata) + b"\r\n")],
+        data_format="REAL,64",
+    ) as inst:
+        with pytest.raises(ConnectionError, match="line feed"):
+            inst.get_xdata()
+        inst.read_bytes(1)  # consume the rest of the reply
+
+
+def test_data_format_queried_before_trace():
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA?", b"ASCII\n"),
+         (b":TRACe:Y? TRA", b"-5.80000000E+001,-2.10000000E+002\n")],
+        data_format=None,
+    ) as inst:
+        assert inst.get_ydata().tolist() == [-58.0, -210.0]
+        assert inst.data_format == "ASCII"
+
+
+def test_get_xdata_prologix():
+    """The default keeps the format of the instrument, which works with a Prologix adapter."""
+    with expected_protocol(
+        PrologixAdapter,
+        [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+         ("++addr 5\n:FORMat:DATA?", None), ("++read eoi", "ASCII"),
+         ("++addr 5\n:TRACe:X? TRA", None), ("++read eoi", "+8.45000000E-007,+8.45100000E-007")],
+        address=5,
+    ) as adapter:
+        inst = AQ6370D(adapter)
+        assert inst.get_xdata().tolist() == [8.45e-07, 8.451e-07]
+
+
+def test_get_xdata_malformed():
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA ASCII", None),
+         (b":TRACe:X? TRA", b"+8.45000000E-007,+8.451#0000E-007,+8.45200000E-007\n")],
+        data_format="ASCII",
+    ) as inst:
+        with pytest.raises(ValueError):
+            inst.get_xdata()
+
+
+def test_get_trace():
+    with expected_protocol(
+        AQ6370D,
+        [(b":FORMat:DATA ASCII", None)] + [
+            (b":TRACe:X? TRB", b"+8.45000000E-007,+8.45100000E-007,+8.45200000E-007\n"),
+            (b":TRACe:Y? TRB", b"-5.80586383E+001,-4.82452558E+001,-2.10000000E+002\n"),
+        ],
+        data_format="ASCII",
+    ) as inst:
+        xdata, ydata = inst.get_trace("TRB")
+        assert xdata.tolist() == [8.45e-07, 8.451e-07, 8.452e-07]
+        assert ydata.tolist() == [-58.0586383, -48.2452558, -210.0]
+
+
 def test_initiate_sweep():
     with expected_protocol(
         AQ6370D,